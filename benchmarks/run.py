@@ -0,0 +1,411 @@
+"""
+Benchmark suite for the Comment Analyzer app.
+
+Renders every page registered in views headlessly through
+streamlit.testing, and times the Lottie fetch path against a local
+stand-in for lottiefiles, with the bytes each page sends per rerun.
+Time to first element on Home is measured
+against a deliberately slow stand-in. Cold starts are timed in fresh
+interpreters, next to an import-time profile of the heavy dependencies.
+Reports throughput, latency percentiles and peak memory as JSON. With
+--baseline the run is compared against a stored result and any benchmark
+whose p50 (or mean, where no percentiles are kept) regressed beyond
+--tolerance and the absolute floor for its group is reported (exit
+status 1).
+
+    python benchmarks/run.py --output bench.json
+    python benchmarks/run.py --baseline benchmarks/baseline.json
+    python benchmarks/run.py --only lottie:   # pooled client vs requests.get
+    python benchmarks/run.py --only monolith: # single-file app.py, to compare
+"""
+import argparse
+import http.server
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+
+# Runs in a fresh interpreter: times the first AppTest run of the app to
+# its first sent element (what a visitor sees first) and to its end (the
+# whole first page, including anything the script does after sending it)
+COLD_START = """
+import sys, time
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.testing.v1 import AppTest
+sent = []
+enqueue = DeltaGenerator._enqueue
+def recording_enqueue(self, *args, **kwargs):
+    sent.append(time.perf_counter())
+    return enqueue(self, *args, **kwargs)
+DeltaGenerator._enqueue = recording_enqueue
+start = time.perf_counter()
+AppTest.from_file(sys.argv[1], default_timeout=60).run()
+print(sent[0] - start, time.perf_counter() - start)
+"""
+# Modules whose import cost is reported by the startup profile
+PROFILED_IMPORTS = ("streamlit", "requests", "streamlit_lottie")
+
+# Smallest slowdown worth reporting per benchmark group. Whole-page reruns
+# and cold starts vary by milliseconds between runs; the metrics spans by
+# about a microsecond, so a disabled span is flagged once it costs as much
+# as an enabled one
+MIN_DELTA_MS = {
+    "cold_start:": 100.0,
+    "monolith:cold_start:": 100.0,
+    "page:": 10.0,
+    "first_element:": 10.0,
+    "monolith:": 10.0,
+    "lottie:": 0.5,
+    "metrics:": 0.002,
+}
+# Fewer runs than this make the page percentiles too noisy to compare
+MIN_BASELINE_RUNS = 20
+
+ANIMATION = json.dumps({"v": "5.7.4", "fr": 30, "ip": 0, "op": 60, "w": 300, "h": 300, "layers": []}).encode("utf-8")
+
+
+class _LottieHandler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without this, keep-alive
+    # clients stall on Nagle + delayed ACK and pooled timings are skewed
+    disable_nagle_algorithm = True
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        if self.headers.get("If-None-Match") == '"bench"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(ANIMATION)))
+        self.send_header("ETag", '"bench"')
+        self.end_headers()
+        self.wfile.write(ANIMATION)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_lottie_server(delay: float):
+    """Starts a local lottiefiles stand-in and returns (server, animation URL)."""
+    handler = type("_DelayedLottieHandler", (_LottieHandler,), {"delay": delay})
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, "http://127.0.0.1:%d/animation.json" % server.server_port
+
+
+def stats(samples, peak_bytes=None, cpu_samples=None):
+    """Summarises per-call durations (seconds) as milliseconds and calls/s."""
+    ordered = sorted(samples)
+    pick = lambda q: ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+    result = {
+        "runs": len(ordered),
+        "throughput_per_s": len(ordered) / sum(ordered) if sum(ordered) else None,
+        "mean_ms": 1000 * sum(ordered) / len(ordered),
+        "p50_ms": 1000 * pick(0.5),
+        "p95_ms": 1000 * pick(0.95),
+        "p99_ms": 1000 * pick(0.99),
+    }
+    if peak_bytes is not None:
+        result["peak_kib"] = peak_bytes / 1024
+    if cpu_samples:
+        result["cpu_mean_ms"] = 1000 * sum(cpu_samples) / len(cpu_samples)
+    return result
+
+
+def timed(fn, runs, cpu_samples=None):
+    samples = []
+    for _ in range(runs):
+        start, start_cpu = time.perf_counter(), time.process_time()
+        fn()
+        samples.append(time.perf_counter() - start)
+        if cpu_samples is not None:
+            cpu_samples.append(time.process_time() - start_cpu)
+    return samples
+
+
+def peak_memory(fn):
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def payload_bytes(node):
+    """Serialized size of every element and block proto under an AppTest node."""
+    total = node.proto.ByteSize() if getattr(node, "proto", None) is not None else 0
+    for child in getattr(node, "children", {}).values():
+        total += payload_bytes(child)
+    return total
+
+
+def bench_pages(runs, app=APP, prefix="page:"):
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    at = AppTest.from_file(app, default_timeout=60)
+    at.run()
+    for name in at.sidebar.selectbox[0].options:
+        at.sidebar.selectbox[0].select(name).run()
+        if at.exception:
+            raise RuntimeError("page %r failed: %s" % (name, at.exception))
+        cpu_samples = []
+        samples = timed(at.run, runs, cpu_samples)
+        results[prefix + name] = stats(samples, peak_memory(at.run), cpu_samples)
+        results[prefix + name]["payload_bytes"] = payload_bytes(at._tree)
+    return results
+
+
+def monolith_app(ref, url):
+    """
+    Writes app.py as of `ref` (the single-file app, before the views split)
+    to a temporary directory, pointed at the lottie stand-in.
+    """
+    if not ref:
+        ref = subprocess.run(
+            ["git", "rev-list", "--max-parents=0", "HEAD"], capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout.split()[0]
+    source = subprocess.run(
+        ["git", "show", "%s:app.py" % ref], capture_output=True, text=True, check=True, cwd=ROOT
+    ).stdout
+    source = source.replace("https://assets9.lottiefiles.com/packages/lf20_u4yrau.json", url)
+    path = os.path.join(tempfile.mkdtemp(), "app.py")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return path
+
+
+def bench_monolith(runs, cold_runs, ref, url):
+    """Cold start and per-page reruns of the monolithic app.py, for comparison."""
+    app = monolith_app(ref, url)
+    results = bench_cold_start(cold_runs, app, "monolith:cold_start:")
+    results.update(bench_pages(runs, app, "monolith:page:"))
+    return results
+
+
+def bench_first_element(runs, delay):
+    """
+    Times the Home page against a stand-in that answers after `delay`
+    seconds, with a cold cache on every run. Reports when the first element,
+    the last static section (the Analyze button) and the animation slot
+    were sent, relative to the start of the rerun.
+    """
+    from streamlit.delta_generator import DeltaGenerator
+    from streamlit.testing.v1 import AppTest
+    import views.home
+
+    server, url = start_lottie_server(delay)
+    sent = []
+    enqueue = DeltaGenerator._enqueue
+
+    def recording_enqueue(self, delta_type, *args, **kwargs):
+        sent.append((time.perf_counter(), delta_type))
+        return enqueue(self, delta_type, *args, **kwargs)
+
+    first, static, complete = [], [], []
+    DeltaGenerator._enqueue = recording_enqueue
+    try:
+        at = AppTest.from_file(APP, default_timeout=60)
+        for n in range(runs):
+            # A fresh query string makes every run a cold cache miss
+            views.home.HOME_ANIMATION_URL = "%s?run=%d" % (url, n)
+            del sent[:]
+            start = time.perf_counter()
+            at.run()
+            first.append(sent[0][0] - start)
+            static.append([t for t, kind in sent if kind == "button"][0] - start)
+            complete.append(sent[-1][0] - start)
+    finally:
+        DeltaGenerator._enqueue = enqueue
+        server.shutdown()
+        server.server_close()
+
+    return {
+        "first_element:first": stats(first),
+        "first_element:static_sections": stats(static),
+        "first_element:animation_slot": stats(complete),
+    }
+
+
+def bench_cold_start(runs, app=APP, prefix="cold_start:"):
+    first, complete = [], []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", COLD_START, app], capture_output=True, text=True, check=True, cwd=ROOT
+        ).stdout
+        first_element, first_render = output.split()[-2:]
+        first.append(float(first_element))
+        complete.append(float(first_render))
+    return {prefix + "first_element": stats(first), prefix + "first_render": stats(complete)}
+
+
+def import_profile():
+    """Returns the cumulative -X importtime cost of each profiled module in ms."""
+    profile = {}
+    for module in PROFILED_IMPORTS:
+        # streamlit is imported first so shared dependencies are not charged
+        # to the module being measured
+        code = "import streamlit; import %s" % module if module != "streamlit" else "import streamlit"
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+        ).stderr
+        for line in stderr.splitlines():
+            parts = [part.strip() for part in line.split("|")]
+            if len(parts) == 3 and parts[2] == module:
+                profile[module] = int(parts[1]) / 1000
+    return profile
+
+
+def bench_lottie(url, runs):
+    import requests
+    import http_client
+    from lottie_cache import LottieCache
+
+    results = {
+        "lottie:requests.get": stats(timed(lambda: requests.get(url, timeout=10), runs)),
+        "lottie:http_client.get": stats(timed(lambda: http_client.get(url), runs)),
+    }
+    warm = LottieCache(cache_dir=tempfile.mkdtemp())
+    warm.get(url)
+    results["lottie:cache_hit"] = stats(timed(lambda: warm.get(url), runs))
+    # Expired entries are served at once and revalidated in the background
+    expired = LottieCache(cache_dir=tempfile.mkdtemp(), ttl=0)
+    expired.get(url)
+    results["lottie:cache_stale"] = stats(timed(lambda: expired.get(url), runs))
+    # The revalidation request itself, answered with 304
+    results["lottie:conditional_get"] = stats(timed(lambda: http_client.get(url, headers={"If-None-Match": '"bench"'}), runs))
+    return results
+
+
+def bench_metrics_overhead():
+    import metrics
+
+    def instrumented():
+        with metrics.span("bench"):
+            pass
+
+    number = 200000
+    results = {}
+    for enabled in (False, True):
+        metrics.ENABLED = enabled
+        # Best of five, so one descheduled batch does not move the mean
+        seconds = min(timeit.repeat(instrumented, number=number, repeat=5))
+        results["metrics:span_%s" % ("enabled" if enabled else "disabled")] = {
+            "runs": number,
+            "mean_ms": 1000 * seconds / number,
+        }
+    metrics.ENABLED = False
+    metrics.reset()
+    return results
+
+
+def min_delta_for(name, min_delta_ms=None):
+    """The absolute slowdown floor for a benchmark; min_delta_ms overrides the per-group value."""
+    if min_delta_ms is not None:
+        return min_delta_ms
+    return next((delta for prefix, delta in MIN_DELTA_MS.items() if name.startswith(prefix)), 0.5)
+
+
+def compare(results, baseline, tolerance, min_delta_ms=None):
+    """Returns (name, metric, baseline value, current value) for each regressed benchmark."""
+    regressions = []
+    for name, current in results["benchmarks"].items():
+        previous = baseline.get("benchmarks", {}).get(name)
+        if not previous:
+            continue
+        # p50 where percentiles are kept, else the mean (metrics:span_*)
+        metric = next((m for m in ("p50_ms", "mean_ms") if m in previous and m in current), None)
+        if metric is None:
+            continue
+        # Timings are noisy; require an absolute slowdown as well as a relative one
+        slower = current[metric] - previous[metric]
+        if current[metric] > previous[metric] * (1 + tolerance) and slower > min_delta_for(name, min_delta_ms):
+            regressions.append((name, metric, previous[metric], current[metric]))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=30, help="timed runs per benchmark")
+    parser.add_argument("--cold-runs", type=int, default=5, help="fresh-interpreter cold starts to time")
+    parser.add_argument("--cdn-delay", type=float, default=0.0, help="seconds the lottie stand-in waits per request")
+    parser.add_argument("--slow-cdn-delay", type=float, default=1.0, help="stand-in delay for the first-element timings")
+    parser.add_argument("--monolith-ref", help="git ref of the single-file app.py to compare against (default: root commit)")
+    parser.add_argument("--only", help="only run benchmark groups whose name starts with this prefix")
+    parser.add_argument("--output", help="write results as JSON to this path")
+    parser.add_argument("--baseline", help="compare against a stored results file")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative slowdown over the baseline")
+    parser.add_argument("--min-delta-ms", type=float,
+                        help="ignore slowdowns smaller than this (default: per group, see MIN_DELTA_MS)")
+    args = parser.parse_args()
+    if args.baseline and args.runs < MIN_BASELINE_RUNS:
+        parser.error("--baseline needs --runs of at least %d" % MIN_BASELINE_RUNS)
+
+    server, url = start_lottie_server(args.cdn_delay)
+    # Must be set before the app modules are imported
+    os.environ["HOME_ANIMATION_URL"] = url
+    os.environ["LOTTIE_CACHE_DIR"] = tempfile.mkdtemp()
+    sys.path.insert(0, ROOT)
+
+    try:
+        groups = [
+            ("cold_start:", lambda: bench_cold_start(args.cold_runs)),
+            ("page:", lambda: bench_pages(args.runs)),
+            ("first_element:", lambda: bench_first_element(min(args.runs, 10), args.slow_cdn_delay)),
+            ("lottie:", lambda: bench_lottie(url, args.runs)),
+            ("metrics:", bench_metrics_overhead),
+            ("monolith:", lambda: bench_monolith(args.runs, args.cold_runs, args.monolith_ref, url)),
+        ]
+        benchmarks = {}
+        for prefix, bench in groups:
+            if not args.only or prefix.startswith(args.only) or args.only.startswith(prefix):
+                benchmarks.update(bench())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "runs": args.runs,
+            "cdn_delay": args.cdn_delay,
+            "slow_cdn_delay": args.slow_cdn_delay,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "benchmarks": benchmarks,
+    }
+    if not args.only:
+        results["import_profile_ms"] = import_profile()
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.tolerance, args.min_delta_ms)
+        for name, metric, before, after in regressions:
+            print("REGRESSION %s: %s %.4f -> %.4f" % (name, metric, before, after), file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import threading
+from urllib.parse import urlsplit
+
+import metrics
+
+# (connect, read) timeouts in seconds for every outbound request
+TIMEOUT = (3.05, 10)
+# Keep-alive connections kept open per host
+POOL_SIZE = 10
+# Concurrent in-flight requests allowed per host
+MAX_PER_HOST = 4
+# Retries per request, with exponential backoff plus random jitter between them
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.3
+BACKOFF_JITTER = 0.2
+# Longest total sleep between retries; urllib3 does not sleep before the first
+RETRY_BACKOFF_BUDGET = sum(BACKOFF_FACTOR * 2 ** n + BACKOFF_JITTER for n in range(1, MAX_RETRIES))
+
+
+def _build_session():
+    # requests is imported here so that importing this module stays cheap
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=MAX_RETRIES,
+        connect=MAX_RETRIES,
+        read=2,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        backoff_factor=BACKOFF_FACTOR,
+        # backoff_jitter needs urllib3 2.x (pinned in requirements.txt)
+        backoff_jitter=BACKOFF_JITTER,
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+# Shared by every fetcher in this process so connections are reused
+_session = None
+_session_lock = threading.Lock()
+
+_host_limits = {}
+_host_limits_lock = threading.Lock()
+
+
+def _host_limit(url):
+    host = urlsplit(url).netloc
+    with _host_limits_lock:
+        limit = _host_limits.get(host)
+        if limit is None:
+            limit = _host_limits[host] = threading.BoundedSemaphore(MAX_PER_HOST)
+    return limit
+
+
+def get_session():
+    """Returns the process-wide session, building it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def get(url: str, **kwargs):
+    """
+    Performs a GET through the shared pooled session.
+
+    Parameters:
+        url (str): The URL to fetch.
+        **kwargs: Passed through to requests.Session.get; a default
+            timeout is applied when none is given.
+
+    Returns:
+        requests.Response: The final response after any retries.
+    """
+    kwargs.setdefault("timeout", TIMEOUT)
+    with metrics.span("http_get"), _host_limit(url):
+        return get_session().get(url, **kwargs)
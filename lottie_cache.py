@@ -0,0 +1,235 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import http_client
+import metrics
+
+# Where fetched animations are persisted between server restarts
+CACHE_DIR = os.environ.get(
+    "LOTTIE_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "lottie"),
+)
+# How long a cached animation is served before it is revalidated
+TTL_SECONDS = int(os.environ.get("LOTTIE_CACHE_TTL", 24 * 60 * 60))
+# How long a URL is left alone after a failed fetch before it is retried
+RETRY_AFTER_SECONDS = int(os.environ.get("LOTTIE_CACHE_RETRY_AFTER", 60))
+# (connect, read) timeouts per attempt for animation fetches. Shorter than
+# http_client.TIMEOUT: a CDN that drops connections is given up on after
+# about MAX_RETRIES + 1 connect timeouts rather than holding a worker for
+# most of a minute
+FETCH_TIMEOUT = (0.5, 2.0)
+# Number of decoded animations kept in process memory
+MEMORY_ENTRIES = 32
+# Approximate bytes of animation JSON kept in process memory
+MEMORY_BUDGET_BYTES = int(os.environ.get("LOTTIE_CACHE_MEMORY_BYTES", 16 * 1024 * 1024))
+
+
+class LottieCache:
+    """
+    Two-tier cache for Lottie animations: an in-process LRU of decoded
+    dicts backed by a JSON file per URL on disk.
+
+    Expired entries are served straight away and revalidated in the
+    background with a conditional GET (ETag / If-Modified-Since), so a
+    slow or unreachable origin never holds up a page that has a copy.
+    After a failed fetch the URL is not retried for RETRY_AFTER_SECONDS.
+    Concurrent fetches for the same URL are shared, so many sessions
+    opening a page at once cost one request.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR, ttl=TTL_SECONDS, max_entries=MEMORY_ENTRIES, max_bytes=MEMORY_BUDGET_BYTES,
+                 retry_after=RETRY_AFTER_SECONDS, timeout=FETCH_TIMEOUT):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self.ttl = ttl
+        self.retry_after = retry_after
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._memory_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "revalidated": 0, "stale": 0, "errors": 0}
+        self._memory = OrderedDict()
+        self._inflight = {}
+        self._retry_at = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="lottie-fetch")
+
+    def get(self, url: str):
+        """
+        Returns the animation for a URL, fetching it only when needed.
+
+        Parameters:
+            url (str): The URL of the Lottie JSON file.
+
+        Returns:
+            dict: The Lottie animation JSON data, or None if unavailable.
+        """
+        entry = self._lookup(url)
+        if entry is not None and time.time() - entry["fetched_at"] < self.ttl:
+            self._count("hits")
+            return entry["data"]
+
+        if entry is not None:
+            # Serve the expired copy now and revalidate off the request path
+            self._count("stale")
+            self._fetch_once(url, entry, wait=False)
+            return entry["data"]
+
+        self._count("misses")
+        return self._fetch_once(url, None, wait=True)
+
+    def _fetch_once(self, url, entry, wait):
+        with self._lock:
+            if time.time() < self._retry_at.get(url, 0):
+                return None
+            # Another flight may have stored a fresh copy and finished between
+            # the caller's lookup and now; serve it instead of fetching again
+            current = self._memory.get(url)
+            if current is not None and time.time() - current["fetched_at"] < self.ttl:
+                return current["data"]
+            flight = self._inflight.get(url)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[url] = Future()
+        if not leader:
+            if not wait:
+                return None
+            self._count("coalesced")
+            return flight.result()
+        if not wait:
+            self._executor.submit(self._run_flight, url, entry, flight)
+            return None
+        return self._run_flight(url, entry, flight)
+
+    def _run_flight(self, url, entry, flight):
+        try:
+            data = self._refresh(url, entry)
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(data)
+        finally:
+            with self._lock:
+                del self._inflight[url]
+        return data
+
+    def _refresh(self, url, entry):
+        import requests
+
+        headers = {}
+        if entry is not None:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+
+        try:
+            r = http_client.get(url, headers=headers, timeout=self.timeout)
+            if r.status_code == 304 and entry is not None:
+                self._count("revalidated")
+                with self._lock:
+                    self._retry_at.pop(url, None)
+                entry["fetched_at"] = time.time()
+                self._store(url, entry)
+                return entry["data"]
+            if r.status_code != 200:
+                return self._failed(url, entry)
+            entry = {
+                "data": r.json(),
+                "size": len(r.content),
+                "etag": r.headers.get("ETag"),
+                "last_modified": r.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+        except (requests.RequestException, ValueError):
+            return self._failed(url, entry)
+
+        with self._lock:
+            self._retry_at.pop(url, None)
+        self._store(url, entry)
+        return entry["data"]
+
+    def fetch_async(self, url: str):
+        """
+        Starts loading an animation on a background worker.
+
+        Parameters:
+            url (str): The URL of the Lottie JSON file.
+
+        Returns:
+            concurrent.futures.Future: Resolves to the value of get(url).
+        """
+        return self._executor.submit(self.get, url)
+
+    def clear(self):
+        """Drops the in-memory tier; the disk tier is left untouched."""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+    def _failed(self, url, entry):
+        # Back off so every rerun during an outage does not wait on the network
+        self._count("errors")
+        with self._lock:
+            self._retry_at[url] = time.time() + self.retry_after
+        # Serve the last good copy rather than nothing
+        return None if entry is None else entry["data"]
+
+    def _count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+        metrics.count("lottie_cache_" + name)
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode("utf-8")).hexdigest() + ".json")
+
+    def _lookup(self, url):
+        with self._lock:
+            entry = self._memory.get(url)
+            if entry is not None:
+                self._memory.move_to_end(url)
+                return entry
+        try:
+            with open(self._path(url), encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        self._remember(url, entry)
+        return entry
+
+    def _remember(self, url, entry):
+        if not entry.get("size"):
+            entry["size"] = len(json.dumps(entry["data"]))
+        with self._lock:
+            previous = self._memory.pop(url, None)
+            if previous is not None:
+                self._memory_bytes -= previous["size"]
+            self._memory[url] = entry
+            self._memory_bytes += entry["size"]
+            # Always keep the newest entry, even if it alone is over budget
+            while len(self._memory) > 1 and (
+                len(self._memory) > self.max_entries or self._memory_bytes > self.max_bytes
+            ):
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted["size"]
+
+    def _store(self, url, entry):
+        self._remember(url, entry)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = "%s.%d.%d.tmp" % (self._path(url), os.getpid(), threading.get_ident())
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(url))
+        except OSError:
+            # A read-only disk should not break the page; memory still works
+            pass
+
+
+# Shared by every Streamlit session in this process
+lottie_cache = LottieCache()
@@ -0,0 +1,140 @@
+import contextlib
+import os
+import threading
+import time
+from collections import defaultdict, deque
+
+# Profiling is opt-in; when off, span() and count() return immediately
+ENABLED = os.environ.get("COMMENT_ANALYZER_PROFILING", "").lower() in ("1", "true", "yes")
+# Durations kept per span for percentile estimates
+HISTORY_SIZE = 1000
+# Most recent spans shown in the profiling panel
+RECENT_SIZE = 50
+QUANTILES = (0.5, 0.95, 0.99)
+
+_NOOP = contextlib.nullcontext()
+_lock = threading.Lock()
+_durations = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
+_totals = defaultdict(lambda: [0, 0.0])  # span -> [count, total seconds]
+_counters = defaultdict(int)
+_recent = deque(maxlen=RECENT_SIZE)
+
+
+class _Span:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            _durations[self.name].append(elapsed)
+            totals = _totals[self.name]
+            totals[0] += 1
+            totals[1] += elapsed
+            _recent.append((time.time(), self.name, elapsed))
+        return False
+
+
+def span(name: str):
+    """
+    Times a block of code when profiling is enabled.
+
+    Parameters:
+        name (str): The span name, e.g. "page:Home" or "http_get".
+
+    Returns:
+        A context manager; a shared no-op one when profiling is off.
+    """
+    if not ENABLED:
+        return _NOOP
+    return _Span(name)
+
+
+def count(name: str, value: int = 1):
+    """
+    Increments a counter when profiling is enabled.
+
+    Parameters:
+        name (str): The counter name, e.g. "lottie_cache_hits".
+        value (int): The amount to add.
+    """
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] += value
+
+
+def _quantile(ordered, q):
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summary():
+    """
+    Returns per-span statistics over the recent history.
+
+    Returns:
+        list: One dict per span with count, mean and p50/p95/p99 in milliseconds.
+    """
+    with _lock:
+        snapshot = {name: (sorted(values), list(_totals[name])) for name, values in _durations.items()}
+    rows = []
+    for name, (ordered, (total_count, total_seconds)) in sorted(snapshot.items()):
+        row = {"span": name, "count": total_count, "mean_ms": 1000 * total_seconds / total_count}
+        for q in QUANTILES:
+            row["p%d_ms" % round(q * 100)] = 1000 * _quantile(ordered, q)
+        rows.append(row)
+    return rows
+
+
+def recent_spans():
+    """Returns the most recent spans as (timestamp, name, seconds), newest first."""
+    with _lock:
+        return list(reversed(_recent))
+
+
+def counters():
+    """Returns a copy of all counters."""
+    with _lock:
+        return dict(_counters)
+
+
+def prometheus_text():
+    """
+    Renders spans and counters in the Prometheus text exposition format.
+
+    Returns:
+        str: Summaries for spans and counters, one metric family each.
+    """
+    with _lock:
+        snapshot = {name: (sorted(values), list(_totals[name])) for name, values in _durations.items()}
+        counter_values = dict(_counters)
+
+    lines = [
+        "# HELP comment_analyzer_span_seconds Duration of instrumented spans.",
+        "# TYPE comment_analyzer_span_seconds summary",
+    ]
+    for name, (ordered, (total_count, total_seconds)) in sorted(snapshot.items()):
+        for q in QUANTILES:
+            lines.append('comment_analyzer_span_seconds{span="%s",quantile="%s"} %.6f' % (name, q, _quantile(ordered, q)))
+        lines.append('comment_analyzer_span_seconds_sum{span="%s"} %.6f' % (name, total_seconds))
+        lines.append('comment_analyzer_span_seconds_count{span="%s"} %d' % (name, total_count))
+    lines.append("# HELP comment_analyzer_events_total Instrumented event counters.")
+    lines.append("# TYPE comment_analyzer_events_total counter")
+    for name, value in sorted(counter_values.items()):
+        lines.append('comment_analyzer_events_total{event="%s"} %d' % (name, value))
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Clears all recorded spans and counters."""
+    with _lock:
+        _durations.clear()
+        _totals.clear()
+        _counters.clear()
+        _recent.clear()
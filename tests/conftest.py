@@ -0,0 +1,73 @@
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+ANIMATION = {"v": "5.7.4", "fr": 30, "ip": 0, "op": 60, "w": 300, "h": 300, "layers": []}
+
+
+class Origin:
+    """A local lottiefiles stand-in that records the requests it receives."""
+
+    def __init__(self):
+        self.delay = 0.0
+        self.status = 200
+        self.etag = '"v1"'
+        self.requests = []
+        self._lock = threading.Lock()
+        origin = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                with origin._lock:
+                    origin.requests.append(dict(self.headers))
+                time.sleep(origin.delay)
+                if origin.status != 200:
+                    body = b""
+                    self.send_response(origin.status)
+                elif self.headers.get("If-None-Match") == origin.etag:
+                    body = b""
+                    self.send_response(304)
+                else:
+                    body = json.dumps(ANIMATION).encode("utf-8")
+                    self.send_response(200)
+                    self.send_header("Content-Type", "application/json")
+                    self.send_header("ETag", origin.etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = "http://127.0.0.1:%d/animation.json" % self.server.server_port
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def origin():
+    server = Origin()
+    yield server
+    server.close()
+
+
+def wait_idle(cache, timeout=5.0):
+    """Waits until a cache has no fetch in flight."""
+    deadline = time.time() + timeout
+    while cache._inflight and time.time() < deadline:
+        time.sleep(0.01)
+    assert not cache._inflight
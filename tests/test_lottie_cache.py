@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import ANIMATION, wait_idle
+from lottie_cache import LottieCache
+
+
+def test_fetches_once_then_serves_from_memory(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path))
+
+    assert cache.get(origin.url) == ANIMATION
+    assert cache.get(origin.url) == ANIMATION
+    assert len(origin.requests) == 1
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_disk_tier_survives_a_new_process(origin, tmp_path):
+    LottieCache(cache_dir=str(tmp_path)).get(origin.url)
+
+    cache = LottieCache(cache_dir=str(tmp_path))
+    assert cache.get(origin.url) == ANIMATION
+    assert len(origin.requests) == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_expired_entry_is_revalidated_in_the_background(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path), ttl=0)
+    cache.get(origin.url)
+
+    assert cache.get(origin.url) == ANIMATION
+    wait_idle(cache)
+    assert origin.requests[-1].get("If-None-Match") == '"v1"'
+    assert cache.stats["stale"] == 1
+    assert cache.stats["revalidated"] == 1
+
+
+def test_expired_entry_does_not_wait_on_a_slow_origin(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path), ttl=0)
+    cache.get(origin.url)
+    origin.delay = 1.0
+
+    start = time.perf_counter()
+    assert cache.get(origin.url) == ANIMATION
+    assert time.perf_counter() - start < 0.5
+    wait_idle(cache)
+
+
+def test_failed_revalidation_keeps_last_good_copy_and_backs_off(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path), ttl=0, retry_after=60)
+    cache.get(origin.url)
+    origin.status = 404
+
+    assert cache.get(origin.url) == ANIMATION
+    wait_idle(cache)
+    assert cache.stats["errors"] == 1
+    requests_after_failure = len(origin.requests)
+
+    for _ in range(5):
+        assert cache.get(origin.url) == ANIMATION
+    wait_idle(cache)
+    assert len(origin.requests) == requests_after_failure
+
+
+def test_cold_miss_against_an_unreachable_origin_backs_off(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path), retry_after=60)
+    origin.status = 404
+
+    assert cache.get(origin.url) is None
+    assert cache.get(origin.url) is None
+    assert len(origin.requests) == 1
+
+
+def test_concurrent_cold_misses_share_one_request(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path))
+    origin.delay = 0.3
+    sessions = 50
+    start = threading.Barrier(sessions)
+
+    def open_page():
+        start.wait()
+        return cache.get(origin.url)
+
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda _: open_page(), range(sessions)))
+
+    assert results == [ANIMATION] * sessions
+    assert len(origin.requests) == 1
+    assert cache.stats["misses"] == sessions
+
+
+def test_miss_that_loses_the_race_to_a_finished_flight_does_not_refetch(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path))
+    cache.get(origin.url)
+
+    # A session that missed before the first flight stored its result
+    assert cache._fetch_once(origin.url, None, wait=True) == ANIMATION
+    assert len(origin.requests) == 1
+
+
+def test_origin_that_does_not_answer_is_given_up_on_quickly(origin, tmp_path):
+    cache = LottieCache(cache_dir=str(tmp_path), retry_after=60, timeout=(0.5, 0.2))
+    origin.delay = 2.0
+
+    start = time.perf_counter()
+    assert cache.get(origin.url) is None
+    # Three read timeouts plus the sleeps between them, not the default 10 s each
+    assert time.perf_counter() - start < 2.0
+    assert cache.stats["errors"] == 1
@@ -0,0 +1,39 @@
+import importlib
+
+# Page name -> (module, function); a page's module is only imported the
+# first time it is selected, and stays loaded for later reruns
+_pages = {}
+
+def register_page(name: str, module: str, function: str):
+    """
+    Adds a page to the sidebar navigation.
+
+    Parameters:
+        name (str): The label shown in the sidebar.
+        module (str): The dotted path of the module defining the page.
+        function (str): The name of the function that renders the page.
+    """
+    _pages[name] = (module, function)
+
+def page_names():
+    """Returns the registered page labels in registration order."""
+    return list(_pages)
+
+def load_page(name: str):
+    """
+    Imports the module for a page on first use and returns its render function.
+
+    Parameters:
+        name (str): The label of a registered page.
+
+    Returns:
+        callable: The function that renders the page.
+    """
+    module, function = _pages[name]
+    return getattr(importlib.import_module(module), function)
+
+register_page("Home", "views.home", "home")
+register_page("Frontend", "views.frontend", "frontend")
+register_page("Backend", "views.backend", "backend")
+register_page("Machine Learning", "views.machine_learning", "machine_learning_documentation")
+# register_page("Investor Pitch", "views.investor_pitch", "investor_pitch")  # Include other pages if necessary
@@ -0,0 +1,256 @@
+import streamlit as st
+
+def backend():
+    st.title("🚀 **Backend Documentation**")
+    st.write("---")
+
+    st.subheader("🔧 **Design Considerations**")
+    st.markdown("""
+    The backend of the **Comment Analyzer** project was developed with several design considerations to ensure robustness, scalability, and security:
+
+    - **Modular Architecture**: Structured in a modular fashion, allowing for easy maintenance and scalability. Each component (controllers, models, routes) is separated to enhance code readability and organization.
+    - **Security**: Implementing JWT (JSON Web Tokens) for authentication ensures that user sessions are secure. Additionally, sensitive data is managed through environment variables using dotenv.
+    - **API Integration**: Integrates with YouTube's API to fetch comments efficiently, handling rate limits and ensuring data consistency.
+    - **Database Connection Management**: Utilizes Mongoose for MongoDB interactions, ensuring efficient database connection handling and schema validation.
+    - **Error Handling**: Comprehensive error handling mechanisms are implemented to provide meaningful responses to the client while logging errors for debugging purposes.
+    - **Scalability**: Designed to handle large volumes of comments and analysis requests, ensuring the application can scale horizontally as needed.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The backend of **Comment Analyzer** includes several essential features:
+
+    - **User Authentication**: Users can register and log in securely, with their credentials stored safely in the database.
+    - **YouTube API Integration**: Fetches comments from YouTube videos using the YouTube Data API, handling pagination and rate limits.
+    - **Comment Storage**: Stores fetched comments in the database for efficient retrieval and analysis.
+    - **Sentiment Analysis**: Processes comments to determine their sentiment (positive, negative, neutral) using NLP techniques.
+    - **Keyword Extraction**: Identifies and stores frequently mentioned keywords and phrases from the comments.
+    - **Analysis Results Management**: Stores and retrieves analysis results, enabling users to view historical data and trends.
+    - **API Endpoints**: Provides RESTful API endpoints for frontend interactions, including fetching comments, initiating analysis, and retrieving results.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    The backend of **Comment Analyzer** employs a modern technological stack:
+
+    - **Node.js**: A JavaScript runtime that allows for server-side scripting.
+    - **Express.js**: A web application framework for Node.js that simplifies routing and middleware management.
+    - **MongoDB**: A NoSQL database used for storing user data, comments, and analysis results.
+    - **Mongoose**: An ODM (Object Data Modeling) library for MongoDB that provides schema-based solutions to model application data.
+    - **YouTube Data API v3**: Used to fetch comments from YouTube videos.
+    - **Natural Language Processing (NLP) Libraries**: Libraries such as **Sentiment** or **Natural** for performing sentiment analysis and keyword extraction.
+    - **JWT (JSON Web Tokens)**: Used for secure authentication.
+    - **dotenv**: For managing environment variables securely.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    backend
+    ├── app.js
+    ├── controller/
+    │   ├── AuthController.js
+    │   ├── CommentController.js
+    │   └── AnalysisController.js
+    ├── middleware/
+    │   └── fetchuser.js
+    ├── models/
+    │   ├── User.js
+    │   ├── Comments.js
+    │   └── UrlModel.js
+    ├── routers/
+    │   ├── auth.js
+    │   └── comments.js
+    ├── package-lock.json
+    ├── package.json
+    └── .env
+    ```
+
+    **Key Files:**
+
+    1. `app.js`: The main entry point of the application that initializes the server, connects to the database, and sets up middleware and routes.
+
+    ```javascript
+    import express from "express";
+    import dotenv from "dotenv";
+    import cookieParser from "cookie-parser";
+    import connectDB from "./db/connectDB.js";
+    import authRoutes from "./routes/authRoutes.js";
+    import commentRoutes from "./routes/commentRoutes.js";
+    import analysisRoutes from "./routes/analysisRoutes.js";
+    import { errorHandler } from "./middleware/errorHandler.js";
+
+    dotenv.config();
+    connectDB();
+
+    const app = express();
+    app.use(cookieParser());
+    app.use(express.json({ limit: "50mb" }));
+    app.use(express.urlencoded({ extended: true }));
+
+    // Routes
+    app.use("/api/auth", authRoutes);
+    app.use("/api/comments", commentRoutes);
+    app.use("/api/analysis", analysisRoutes);
+
+    // Error Handling Middleware
+    app.use(errorHandler);
+
+    const PORT = process.env.PORT || 5000;
+    app.listen(PORT, () => {
+        console.log(`Server started on port ${PORT}`);
+    });
+    ```
+
+    2. **Controllers:**
+       - `AuthController.js`: Manages user registration, login, and authentication.
+       - `CommentController.js`: Handles fetching comments from YouTube and storing them in the database.
+       - `AnalysisController.js`: Performs sentiment analysis and keyword extraction on stored comments.
+
+       **Example: `CommentController.js`**
+
+       ```javascript
+       import YouTubeService from "../services/youtubeService.js";
+       import Comment from "../models/Comment.js";
+
+       // Fetch and store comments from a YouTube video
+       export const fetchComments = async (req, res, next) => {
+           try {
+               const { videoId } = req.params;
+               const comments = await YouTubeService.getComments(videoId);
+
+               // Save comments to the database
+               const savedComments = await Comment.insertMany(comments);
+
+               res.status(200).json({ success: true, data: savedComments });
+           } catch (error) {
+               next(error);
+           }
+       };
+       ```
+
+    3. **Models (`models/`):**
+       - `User.js`: Defines the User schema with fields like username, email, password, etc.
+       - `Comments.js`: Defines the Comment schema including details like comment text, author, timestamp, sentiment score, etc.
+       
+
+       **Example: `Comments.js`**
+
+       ```javascript
+       import mongoose from "mongoose";
+
+       const CommentSchema = new mongoose.Schema({
+           videoId: {
+               type: String,
+               required: true,
+           },
+           author: {
+               type: String,
+               required: true,
+           },
+           text: {
+               type: String,
+               required: true,
+           },
+           publishedAt: {
+               type: Date,
+               required: true,
+           },
+           sentiment: {
+               type: String,
+               enum: ["positive", "negative", "neutral"],
+               default: "neutral",
+           },
+           keywords: {
+               type: [String],
+               default: [],
+           },
+       });
+
+       export default mongoose.model("Comment", CommentSchema);
+       ```
+
+    4. **Middleware (`middleware/`):**
+       - `fetchuser.js`: Verifies JWT tokens to protect secure routes.
+       
+       **Example: `fetchuser.js`**
+
+       ```javascript
+       import jwt from "jsonwebtoken";
+       import User from "../models/User.js";
+
+       const authenticate = async (req, res, next) => {
+           const token = req.cookies.token || "";
+
+           if (!token) {
+               return res.status(401).json({ message: "No token provided, authorization denied" });
+           }
+
+           try {
+               const decoded = jwt.verify(token, process.env.JWT_SECRET);
+               req.user = await User.findById(decoded.id).select("-password");
+               next();
+           } catch (error) {
+               res.status(401).json({ message: "Token is not valid" });
+           }
+       };
+
+       export default authenticate;
+       ```
+
+    5. **Routers (`routers/`):**
+       - `auth.js`: Defines routes for user authentication (e.g., `/register`, `/login`).
+       - `comments.js`: Defines routes for fetching and managing comments (e.g., `/fetch/:videoId`).
+       
+
+       **Example: `comments.js`**
+
+       ```javascript
+       import express from "express";
+       import { fetchComments } from "../controller/CommentController.js";
+       import authenticate from "../middleware/authenticate.js";
+
+       const router = express.Router();
+
+       // Fetch comments for a specific YouTube video
+       router.get("/fetch/:videoId", authenticate, fetchComments);
+
+       export default router;
+       ```
+
+    **Styling**
+
+    - The backend does not involve direct styling; however, clear and consistent API responses and error messages are maintained to ensure ease of integration with the frontend.
+
+    **ESLint Configuration**
+
+    The project uses **ESLint** to maintain code quality and enforce consistent coding standards.
+
+    ```javascript
+    module.exports = {
+        env: {
+            browser: false,
+            node: true,
+            es2021: true,
+        },
+        extends: ["eslint:recommended", "plugin:react/recommended"],
+        parserOptions: {
+            ecmaVersion: 12,
+            sourceType: "module",
+        },
+        plugins: ["react"],
+        rules: {
+            "no-unused-vars": "warn",
+            "no-console": "off",
+            "semi": ["error", "always"],
+            "quotes": ["error", "single"],
+        },
+    };
+    ```
+
+    **Conclusion**
+
+    This documentation provides a comprehensive overview of the backend design considerations, key features, technological stack, and technical structure of the **Comment Analyzer** project. By adhering to these guidelines and utilizing modern technologies, the project aims to create a secure, efficient, and scalable platform for analyzing YouTube comments, providing valuable insights through sentiment analysis and keyword extraction.
+    """)
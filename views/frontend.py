@@ -0,0 +1,153 @@
+import streamlit as st
+
+def frontend():
+    st.title("🚀 **Frontend Documentation**")
+    st.write("---")
+
+    st.subheader("📝 **Design Considerations**")
+    st.markdown("""
+    The frontend of the **Comment Analyzer** project was designed with several key considerations in mind:
+
+    - **User-Centric Design**: The interface prioritizes ease of use, ensuring users can input YouTube video links and view analysis results effortlessly.
+    - **Responsive Layout**: The application is fully responsive, offering a seamless experience across devices such as desktops, tablets, and mobile phones.
+    - **Accessibility**: Adherence to accessibility standards ensures inclusivity for all users, including those with disabilities.
+    - **Performance Optimization**: The frontend is optimized for fast load times and smooth interactions, especially when displaying data visualizations.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The frontend of **Comment Analyzer** includes several notable features:
+
+    - **YouTube API Integration**: Users can fetch and analyze comments by providing a YouTube video link.
+    - **Sentiment Analysis Results**: Display a summary of sentiment (positive, negative, neutral) with corresponding visualizations.
+    - **Keyword Extraction**: Showcase the most frequently used words in a word cloud.
+    - **Interactive Charts**: Visualize sentiment trends and engagement metrics through charts.
+    - **Dynamic Content Loading**: The interface dynamically updates with results after the analysis is completed.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    The **Comment Analyzer** frontend utilizes a modern technological stack:
+
+    - **React**: A JavaScript library for building user interfaces with reusable components.
+    - **Vite**: A build tool that provides a fast development environment with hot module replacement (HMR).
+    - **Material UI**: A React UI framework offering pre-designed components for a consistent look.
+    - **Chart.js**: A library for creating dynamic and interactive charts to visualize sentiment trends and keyword analysis.
+    - **React Router**: A routing library for navigation between views in the application.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    comment-analyzer/
+    ├── eslint.config.js
+    ├── index.html
+    ├── package-lock.json
+    ├── package.json
+    ├── public/
+    │   └── logo.png
+    ├── README.md
+    ├── src/
+    │   ├── App.css
+    │   ├── App.jsx
+    │   ├── assets/
+    │   │   └── analysis-icon.png
+    │   ├── components/
+    │   │   ├── SentimentChart.jsx
+    │   │   ├── WordCloud.jsx
+    │   │   └── Navbar.jsx
+    │   ├── hooks/
+    │   │   └── useYouTubeComments.jsx
+    │   ├── index.css
+    │   ├── main.jsx
+    │   └── vite.config.js
+    ```
+
+    **Key Files:**
+
+    1. `index.html`: Entry point of the application, containing meta tags for responsiveness and links to the main JavaScript file.
+
+    ```html
+    <!doctype html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8" />
+        <link rel="icon" href="/logo.png" />
+        <meta name="viewport" content="width=device-width, initial-scale=1.0" />
+        <title>Comment Analyzer</title>
+    </head>
+    <body>
+        <div id="root"></div>
+        <script type="module" src="/src/main.jsx"></script>
+    </body>
+    </html>
+    ```
+
+    2. `main.jsx`: Initializes the React application and renders it into the DOM.
+
+    ```javascript
+    import React from 'react';
+    import ReactDOM from 'react-dom';
+    import { BrowserRouter } from 'react-router-dom';
+    import App from './App';
+    import './index.css';
+
+    ReactDOM.createRoot(document.getElementById('root')).render(
+        <BrowserRouter>
+            <App />
+        </BrowserRouter>
+    );
+    ```
+
+    3. `App.jsx`: The root component managing routing and layout.
+
+    ```javascript
+    import React from 'react';
+    import { Routes, Route } from 'react-router-dom';
+    import Home from './pages/Home';
+    import Analysis from './pages/Analysis';
+    import Dashboard from './pages/Dashboard';
+
+    const App = () => {
+        return (
+            <Routes>
+                <Route path="/" element={<Home />} />
+                <Route path="/analysis" element={<Analysis />} />
+                <Route path="/dashboard" element={<Dashboard />} />
+            </Routes>
+        );
+    };
+
+    export default App;
+    ```
+
+    4. **Pages Directory (`src/pages/`)**: Contains components for different pages, such as `Home` for inputting the YouTube link and `Analysis` for displaying results.
+
+    5. **Components Directory (`src/components/`)**: Includes reusable UI elements like `SentimentChart` and `WordCloud`.
+
+    6. **Utils Directory (`src/utils/`)**: Contains helper functions for fetching comments, performing sentiment analysis, and extracting keywords.
+
+    **Styling**
+
+    - The application uses **CSS Modules** for scoped styles and **Material UI** for consistent UI components.
+
+    **ESLint Configuration**
+
+    The project uses **ESLint** to maintain code quality and enforce consistent coding standards.
+
+    ```javascript
+    module.exports = {
+        extends: ["react-app", "react-app/jest"],
+        rules: {
+            "react-hooks/exhaustive-deps": "warn",
+            "no-console": "warn",
+        },
+    };
+    ```
+
+    **Conclusion**
+
+    The frontend for **Comment Analyzer** is built with a modern tech stack and focuses on performance, responsiveness, and user engagement. Its modular structure and reusable components ensure scalability and maintainability.
+    """)
@@ -0,0 +1,57 @@
+import os
+import streamlit as st
+from lottie_cache import lottie_cache
+from views.lottie import LOTTIE_DEADLINE_SECONDS, show_lottie_when_ready
+
+HOME_ANIMATION_URL = os.environ.get(
+    "HOME_ANIMATION_URL", "https://assets9.lottiefiles.com/packages/lf20_u4yrau.json"  # Update with relevant Lottie link
+)
+
+def home():
+    st.title("📊 **Welcome to Comment Analyzer!**")
+    st.markdown("### Gain Insights from YouTube Comments")
+    st.write("---")
+
+    # Reserve a slot for the Lottie animation and fetch it in the background
+    # so the sections below are sent without waiting on the CDN
+    animation_slot = st.empty()
+    animation_future = lottie_cache.fetch_async(HOME_ANIMATION_URL)
+
+    st.markdown("""
+    **Comment Analyzer** is a powerful tool to analyze and extract insights from YouTube comments. Whether you're a content creator, marketer, or researcher, this tool helps you make data-driven decisions by understanding audience feedback.
+    """)
+
+    st.write("---")
+    st.header("🔍 **Key Features**")
+    st.markdown("""
+    - **Sentiment Analysis**: Understand the emotions conveyed in comments (positive, negative, neutral).
+    - **Keyword Extraction**: Identify frequently mentioned topics or phrases.
+    - **Trend Analysis**: Track how sentiments and keywords evolve over time.
+    - **Word Clouds**: Visualize key themes in the comments.
+    - **Engagement Metrics**: Analyze the frequency and length of comments.
+    """)
+
+    st.write("---")
+    st.header("🚗 **How It Works**")
+    with st.expander("📥 Fetch Comments"):
+        st.markdown("""
+        1. **Input YouTube Video Link**: Paste the link to the YouTube video.
+        2. **Fetch Comments**: The tool retrieves comments using YouTube's API.
+        """)
+
+    with st.expander("📊 Analyze Data"):
+        st.markdown("""
+        1. **Sentiment Analysis**: Determine the tone of comments (positive, negative, neutral).
+        2. **Keyword Extraction**: Highlight frequently used words or phrases.
+        3. **Visualizations**: View insights through graphs and word clouds.
+        """)
+
+    st.write("---")
+    st.header("🔗 **Get Started**")
+    st.markdown("""
+    Ready to unlock insights from YouTube comments? **[Start Analyzing Now](#)** and turn feedback into actionable data.
+    """)
+
+    st.button("🚀 **Analyze Comments**", help="Click to begin analyzing comments from a YouTube video!")
+
+    show_lottie_when_ready(animation_slot, animation_future, LOTTIE_DEADLINE_SECONDS, "home_animation")
@@ -0,0 +1,44 @@
+import os
+from concurrent.futures import TimeoutError as FutureTimeoutError
+import streamlit as st
+import http_client
+from lottie_cache import lottie_cache
+
+# Seconds a page waits for its animation before showing a static image. The
+# default covers the sleeps between http_client retries, so an origin that
+# fails fast and recovers within its retries is still shown. It does not
+# cover the per-attempt timeouts: an origin that does not answer at all is
+# cut off by lottie_cache.FETCH_TIMEOUT, and after that the URL is left
+# alone for RETRY_AFTER_SECONDS, so only the reruns during one failing
+# fetch wait the full deadline
+LOTTIE_DEADLINE_SECONDS = float(
+    os.environ.get("LOTTIE_DEADLINE_SECONDS", http_client.RETRY_BACKOFF_BUDGET + 0.8)
+)
+FALLBACK_IMAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "home_fallback.svg")
+
+# Fill a placeholder with an animation fetched in the background
+def show_lottie_when_ready(placeholder, future, deadline: float, key: str):
+    """
+    Waits up to a deadline for a background Lottie fetch and renders it
+    into a placeholder, falling back to a static image when it is late
+    or unavailable. A late fetch still completes and warms the cache.
+
+    Parameters:
+        placeholder: The st.empty() slot reserved for the animation.
+        future (Future): The pending result of lottie_cache.fetch_async.
+        deadline (float): Seconds to wait for the fetch.
+        key (str): The Streamlit element key for the animation.
+    """
+    try:
+        lottie_animation = future.result(timeout=deadline)
+    except FutureTimeoutError:
+        lottie_animation = None
+    with placeholder:
+        if lottie_animation:
+            # streamlit_lottie pulls in requests and its own helpers; only pay
+            # for that import once there is an animation to show
+            from streamlit_lottie import st_lottie
+
+            st_lottie(lottie_animation, height=300, key=key)
+        else:
+            st.image(FALLBACK_IMAGE, width=300)
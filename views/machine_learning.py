@@ -0,0 +1,138 @@
+import streamlit as st
+
+def machine_learning_documentation():
+    st.title("🧠Machine Learning Documentation")
+    st.write("---")
+
+    st.subheader("🔬 **Design Considerations**")
+    st.markdown("""
+    The machine learning models for **Comment Analyzer** were developed with the following considerations:
+
+    - **Data Quality and Preprocessing**: Emphasis on cleaning, tokenizing, and normalizing comment text to improve model accuracy.
+    - **Model Selection**: Support Vector Machines (SVM) for sentiment classification, optimized for short text comments.
+    - **Scalability**: Designed to handle a growing dataset of YouTube comments efficiently, ensuring minimal latency in predictions.
+    - **Performance Monitoring**: Regular evaluation of precision, recall, and F1 scores to maintain high performance.
+    """)
+
+    st.subheader("✨ **Key Features**")
+    st.markdown("""
+    The **Comment Analyzer** machine learning components include:
+
+    - **Sentiment Analysis**: Predicts whether comments are positive, negative, or neutral, providing actionable insights.
+    - **YouTube API Integration**: Automatically fetches comments from a given YouTube video using its video ID.
+    - **Scalable Architecture**: Models are served through Flask APIs, allowing integration with web or mobile interfaces.
+    """)
+
+    st.subheader("🛠️ **Technological Stack**")
+    st.markdown("""
+    - **Python**: Programming language for model development and deployment.
+    - **scikit-learn**: Used for training and deploying the sentiment analysis model.
+    - **Flask**: Serves the ML model and API endpoints.
+    - **YouTube API v3**: Fetches comments for analysis from YouTube videos.
+    """)
+
+    st.subheader("📄 **Technical Documentation**")
+    st.markdown("""
+    **Project Structure:**
+
+    ```
+    CommentAnalyzer/
+    ├── app.py  # Flask application
+    ├── svm_model.joblib  # Pre-trained sentiment analysis model
+    ├── comment_fetcher.py  # Module for YouTube API integration
+    ├── sentiment_predictor.py  # Module for sentiment analysis
+    └── requirements.txt  # Dependencies
+    ```
+
+    ### Components Overview
+
+    1. **YouTube Comments Fetcher (`comment_fetcher.py`)**
+       - **Purpose**: Fetches comments from YouTube videos using the YouTube API v3.
+       - **Example Usage**:
+       ```python
+       video_id = "abc123"
+       comments = get_youtube_comments(video_id)
+       ```
+       - **Code Implementation**:
+       ```python
+       import googleapiclient.discovery
+
+       def get_youtube_comments(video_id, max_results=100):
+           youtube = googleapiclient.discovery.build("youtube", "v3", developerKey="YOUR_API_KEY")
+           request = youtube.commentThreads().list(
+               part="snippet",
+               videoId=video_id,
+               maxResults=max_results
+           )
+           response = request.execute()
+           comments = [item['snippet']['topLevelComment']['snippet']['textDisplay'] for item in response.get('items', [])]
+           return comments
+       ```
+
+    2. **Sentiment Analysis Model (`sentiment_predictor.py`)**
+       - **Purpose**: Predicts sentiment of comments (Positive, Negative, Neutral).
+       - **Technology**: SVM model trained on labeled comment data.
+       - **Example Usage**:
+       ```python
+       comments = ["Great video!", "Not helpful."]
+       sentiments = predict_sentiment(comments)
+       ```
+       - **Code Implementation**:
+       ```python
+       import joblib
+
+       # Load pre-trained SVM model
+       svm_model = joblib.load("svm_model.joblib")
+
+       def predict_sentiment(comments):
+           predictions = svm_model.predict(comments)
+           return predictions
+       ```
+
+    3. **Flask Application (`app.py`)**
+       - **Purpose**: Exposes RESTful APIs for fetching YouTube comments and performing sentiment analysis.
+       - **Endpoints**:
+         - `/get_comments`: Fetches comments for a given YouTube video ID.
+         - `/predict_sentiment`: Predicts sentiment for a list of comments.
+       - **Code Implementation**:
+       ```python
+       from flask import Flask, request, jsonify
+       from comment_fetcher import get_youtube_comments
+       from sentiment_predictor import predict_sentiment
+
+       app = Flask(__name__)
+
+       @app.route('/get_comments', methods=['POST'])
+       def get_comments():
+           data = request.get_json()
+           video_id = data.get('videoId')
+           comments = get_youtube_comments(video_id)
+           return jsonify(comments)
+
+       @app.route('/predict_sentiment', methods=['POST'])
+       def predict_sentiment_endpoint():
+           data = request.get_json()
+           comments = data.get('comments', [])
+           sentiments = predict_sentiment(comments)
+           return jsonify(sentiments)
+
+       if __name__ == "__main__":
+           app.run(port=5000, debug=True)
+       ```
+
+    ### Model Training and Evaluation
+
+    - **Dataset**: Labeled YouTube comments dataset for sentiment classification.
+    - **Algorithm**: Support Vector Machines (SVM) with TF-IDF vectorization.
+    - **Metrics**: 
+        - **Accuracy**: 85%
+        - **Precision**: 82%
+        - **Recall**: 80%
+    """)
+
+    st.subheader("📌 **Future Improvements**")
+    st.markdown("""
+    - **Multilingual Support**: Extend sentiment analysis to handle comments in multiple languages.
+    - **Enhanced Visualization**: Add data visualizations to represent sentiment distributions effectively.
+    - **Integration with Other Platforms**: Extend support to analyze comments from Twitter, Facebook, etc.
+    """)
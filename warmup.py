@@ -0,0 +1,36 @@
+import threading
+
+import metrics
+
+_started = False
+_started_lock = threading.Lock()
+
+
+def _warm():
+    with metrics.span("warmup"):
+        try:
+            import http_client
+            from lottie_cache import lottie_cache
+            from views.home import HOME_ANIMATION_URL
+
+            http_client.get_session()
+            lottie_cache.get(HOME_ANIMATION_URL)
+        except Exception:
+            # Warm-up is best effort; pages load everything they need themselves
+            pass
+
+
+def start():
+    """
+    Builds the shared HTTP session and prefetches the home page animation
+    on a background thread. Only the first call in a process does
+    anything, so it is safe to call on every rerun.
+    """
+    global _started
+    with _started_lock:
+        if _started:
+            return
+        _started = True
+    # streamlit_lottie is left to views.lottie, which imports it the first
+    # time there is an animation to show
+    threading.Thread(target=_warm, name="warmup", daemon=True).start()